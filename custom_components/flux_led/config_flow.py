@@ -138,7 +138,9 @@ class OptionsFlow(config_entries.OptionsFlow):
                 )
 
                 async_dispatcher_send(
-                    self.hass, SIGNAL_REMOVE_DEVICE, {"device_id": device_id}
+                    self.hass,
+                    f"{SIGNAL_REMOVE_DEVICE}_{device_id}",
+                    {"device_id": device_id},
                 )
 
                 options_data = self._config_entry.options.copy()
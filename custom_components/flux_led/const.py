@@ -11,6 +11,11 @@ ATTR_MODEL = "model"
 DEFAULT_NETWORK_SCAN_INTERVAL = 120
 DEFAULT_SCAN_INTERVAL = 5
 DEFAULT_EFFECT_SPEED = 50
+DEFAULT_CONNECTION_IDLE_TIMEOUT = 60
+DEFAULT_COMMAND_BATCH_DELAY = 0.04
+DEFAULT_TURN_ON_THROTTLE = 0.1
+DEFAULT_RECONNECT_MIN_BACKOFF = 1
+DEFAULT_RECONNECT_MAX_BACKOFF = 30
 
 SIGNAL_ADD_DEVICE = "flux_led_add_device"
 SIGNAL_REMOVE_DEVICE = "flux_led_remove_device"
@@ -1,8 +1,13 @@
 """Support for FluxLED/MagicHome lights."""
 
+import asyncio
 from datetime import timedelta
+from functools import lru_cache, partial, wraps
 import logging
 import random
+import threading
+import time
+from types import MappingProxyType
 
 from flux_led import WifiLedBulb
 import voluptuous as vol
@@ -32,12 +37,16 @@ from homeassistant.const import (
     CONF_NAME,
     CONF_PROTOCOL,
 )
+from homeassistant.core import callback
 from homeassistant.exceptions import PlatformNotReady
 from homeassistant.helpers import entity_platform
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_registry import async_entries_for_device
-from homeassistant.util import Throttle
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+)
 import homeassistant.util.color as color_util
 
 from .const import (
@@ -46,8 +55,13 @@ from .const import (
     ATTR_MODEL,
     CONF_AUTOMATIC_ADD,
     CONF_EFFECT_SPEED,
+    DEFAULT_COMMAND_BATCH_DELAY,
+    DEFAULT_CONNECTION_IDLE_TIMEOUT,
     DEFAULT_EFFECT_SPEED,
+    DEFAULT_RECONNECT_MAX_BACKOFF,
+    DEFAULT_RECONNECT_MIN_BACKOFF,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TURN_ON_THROTTLE,
     DOMAIN,
     SIGNAL_ADD_DEVICE,
     SIGNAL_REMOVE_DEVICE,
@@ -62,6 +76,9 @@ CONF_CUSTOM_EFFECT = "custom_effect"
 
 SUPPORT_FLUX_LED = SUPPORT_BRIGHTNESS | SUPPORT_EFFECT | SUPPORT_COLOR
 
+# turn_on calls only changing these are throttled, e.g. while dragging a slider
+THROTTLED_TURN_ON_ATTRS = {ATTR_BRIGHTNESS, ATTR_HS_COLOR}
+
 MODE_RGB = "rgb"
 MODE_RGBW = "rgbw"
 MODE_RGBCW = "rgbcw"
@@ -71,10 +88,44 @@ MODE_RGBWW = "rgbww"
 # RGB value is ignored when this mode is specified.
 MODE_WHITE = "w"
 
+_SUPPORTED_FEATURES_BY_MODE = {
+    MODE_RGBW: SUPPORT_FLUX_LED | SUPPORT_WHITE_VALUE | SUPPORT_COLOR_TEMP,
+    MODE_RGBCW: SUPPORT_FLUX_LED | SUPPORT_WHITE_VALUE | SUPPORT_COLOR_TEMP,
+    MODE_RGBWW: SUPPORT_FLUX_LED | SUPPORT_WHITE_VALUE,
+}
+
 # Constant color temp values for 2 flux_led special modes
 # Warm-white and Cool-white modes
 COLOR_TEMP_WARM_VS_COLD_WHITE_CUT_OFF = 285
 
+# Map mired range from light input to kelvin range for bulb
+MIRED_MIN = 500
+MIRED_MAX = 153
+KELVIN_MIN = 2700
+KELVIN_MAX = 6500
+
+
+def _mired_to_warm_cold(color_temp):
+    """Return the (warm, cold) white ratios for a color temp in mired."""
+    # Map mired to kelvin specifically for the setWhiteTemperature since it wants 2700~6500 kelvin and
+    # we have 153~500 mired as an input which doesn't match up the way we want
+    color_temp_kelvin = (color_temp - MIRED_MIN) / (MIRED_MAX - MIRED_MIN) * (
+        KELVIN_MAX - KELVIN_MIN
+    ) + KELVIN_MIN
+
+    color_temp_kelvin = max(color_temp_kelvin - KELVIN_MIN, 0)
+    kelvin_range = KELVIN_MAX - KELVIN_MIN
+    return (
+        1 - (color_temp_kelvin / kelvin_range),
+        min(color_temp_kelvin / kelvin_range, 1),
+    )
+
+
+# RGBCW warm/cold ratios for every mired value the light accepts
+_MIRED_TO_WARM_COLD = {
+    mired: _mired_to_warm_cold(mired) for mired in range(MIRED_MAX, MIRED_MIN + 1)
+}
+
 # List of supported effects which aren't already declared in LIGHT
 EFFECT_RED_FADE = "red_fade"
 EFFECT_GREEN_FADE = "green_fade"
@@ -119,21 +170,26 @@ EFFECT_MAP = {
     EFFECT_WHITE_STROBE: 0x37,
     EFFECT_COLORJUMP: 0x38,
 }
+EFFECT_ID_TO_NAME = {code: name for name, code in EFFECT_MAP.items()}
 EFFECT_CUSTOM_CODE = 0x60
 
 TRANSITION_GRADUAL = "gradual"
 TRANSITION_JUMP = "jump"
 TRANSITION_STROBE = "strobe"
 
-FLUX_EFFECT_LIST = sorted(EFFECT_MAP) + [EFFECT_RANDOM]
+FLUX_EFFECT_LIST = tuple(sorted(EFFECT_MAP)) + (EFFECT_RANDOM, EFFECT_CUSTOM)
 
 SERVICE_CUSTOM_EFFECT = "set_custom_effect"
 
+COLOR_SCHEMA = vol.All(
+    vol.ExactSequence((cv.byte, cv.byte, cv.byte)), vol.Coerce(tuple)
+)
+
 CUSTOM_EFFECT_SCHEMA = {
     vol.Required(CONF_COLORS): vol.All(
         cv.ensure_list,
         vol.Length(min=1, max=16),
-        [vol.All(vol.ExactSequence((cv.byte, cv.byte, cv.byte)), vol.Coerce(tuple))],
+        [COLOR_SCHEMA],
     ),
     vol.Optional(CONF_SPEED_PCT, default=50): vol.All(
         vol.Range(min=0, max=100), vol.Coerce(int)
@@ -143,6 +199,8 @@ CUSTOM_EFFECT_SCHEMA = {
     ),
 }
 
+CUSTOM_EFFECT_SERVICE_SCHEMA = cv.make_entity_service_schema(CUSTOM_EFFECT_SCHEMA)
+
 DEVICE_SCHEMA = vol.Schema(
     {
         vol.Optional(CONF_NAME): cv.string,
@@ -150,7 +208,7 @@ DEVICE_SCHEMA = vol.Schema(
             cv.string, vol.In([MODE_RGBW, MODE_RGBWW, MODE_RGBCW, MODE_RGB, MODE_WHITE])
         ),
         vol.Optional(CONF_PROTOCOL): vol.All(cv.string, vol.In(["ledenet"])),
-        vol.Optional(CONF_CUSTOM_EFFECT): CUSTOM_EFFECT_SCHEMA,
+        vol.Optional(CONF_CUSTOM_EFFECT): vol.Schema(CUSTOM_EFFECT_SCHEMA),
     }
 )
 
@@ -162,20 +220,52 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
 )
 
 
+@lru_cache(maxsize=2048)
+def _rgb_to_hs(red, green, blue):
+    """Return the cached hue/saturation for an RGB color.
+
+    Same result as color_util.color_RGB_to_hs, computed inline instead of
+    going through colorsys and the value channel.
+    """
+    red, green, blue = red / 255, green / 255, blue / 255
+    max_c = max(red, green, blue)
+    delta = max_c - min(red, green, blue)
+
+    if not delta:
+        return 0.0, 0.0
+
+    red_c = (max_c - red) / delta
+    green_c = (max_c - green) / delta
+    blue_c = (max_c - blue) / delta
+
+    if red == max_c:
+        hue = blue_c - green_c
+    elif green == max_c:
+        hue = 2.0 + red_c - blue_c
+    else:
+        hue = 4.0 + green_c - red_c
+
+    return round((hue / 6.0) % 1.0 * 360, 3), round(delta / max_c * 100, 3)
+
+
+@lru_cache(maxsize=2048)
+def _hs_to_rgb(hue, saturation):
+    """Return the cached RGB color for a hue/saturation."""
+    return color_util.color_hs_to_RGB(hue, saturation)
+
+
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Set up the platform and manage importing from YAML."""
     automatic_add = config["automatic_add"]
-    devices = {}
-
-    for import_host, import_item in config["devices"].items():
-        import_name = import_host
-        if import_item:
-            import_name = import_item.get("name", import_host)
-
-        devices[import_host.replace(".", "_")] = {
-            CONF_NAME: import_name,
+    devices = {
+        import_host.replace(".", "_"): {
+            CONF_NAME: (
+                import_item.get(CONF_NAME, import_host) if import_item else import_host
+            ),
             CONF_HOST: import_host,
         }
+        for import_host, import_item in config["devices"].items()
+    }
 
     await hass.config_entries.flow.async_init(
         DOMAIN,
@@ -190,6 +280,8 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up the Flux lights."""
 
+    coordinator = FluxLedUpdateCoordinator(hass)
+
     async def async_new_lights(bulbs: dict):
         """Add new bulbs when they are found or configured."""
 
@@ -205,12 +297,15 @@ async def async_setup_entry(hass, entry, async_add_entities):
 
             host = bulb_details[CONF_HOST]
             try:
-                bulb = await hass.async_add_executor_job(WifiLedBulb, host)
-            except BrokenPipeError as error:
+                bulb = await hass.async_add_executor_job(PooledBulb, host)
+            except OSError as error:
                 raise PlatformNotReady(error) from error
 
+            coordinator.bulbs[bulb_id] = bulb
+
             lights.append(
                 FluxLight(
+                    coordinator=coordinator,
                     unique_id=bulb_id,
                     device=bulb_details,
                     effect_speed=effect_speed,
@@ -218,7 +313,9 @@ async def async_setup_entry(hass, entry, async_add_entities):
                 )
             )
 
-        async_add_entities(lights, True)
+        await coordinator.async_refresh()
+
+        async_add_entities(lights)
 
     await async_new_lights(entry.data[CONF_DEVICES])
 
@@ -229,20 +326,235 @@ async def async_setup_entry(hass, entry, async_add_entities):
 
     platform.async_register_entity_service(
         SERVICE_CUSTOM_EFFECT,
-        CUSTOM_EFFECT_SCHEMA,
+        CUSTOM_EFFECT_SERVICE_SCHEMA,
         "set_custom_effect",
     )
 
 
-class FluxLight(LightEntity):
+# First byte of a state reply, for the default and the original LEDENET protocol
+STATE_RESPONSE_HEADERS = (0x81, 0x66)
+
+
+def _serialized(method):
+    """Hold the bulb's request lock for the whole call, including replies."""
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._request_lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class PooledBulb(WifiLedBulb):
+    """WifiLedBulb which keeps its socket open between commands and polls."""
+
+    def __init__(self, ipaddr: str):
+        """Initialize the bulb and open the connection."""
+        # Unlike the library's _lock, which only guards single socket calls,
+        # this keeps each request and its reply together on the shared socket.
+        self._request_lock = threading.RLock()
+        self.last_used = 0
+        self._connected = False
+        self._backoff = DEFAULT_RECONNECT_MIN_BACKOFF
+        self._reconnect_at = 0
+
+        super().__init__(ipaddr)
+
+    update_state = _serialized(WifiLedBulb.update_state)
+    turnOn = _serialized(WifiLedBulb.turnOn)
+    turnOff = _serialized(WifiLedBulb.turnOff)
+    setRgbw = _serialized(WifiLedBulb.setRgbw)
+    setRgb = _serialized(WifiLedBulb.setRgb)
+    setWarmWhite255 = _serialized(WifiLedBulb.setWarmWhite255)
+    setPresetPattern = _serialized(WifiLedBulb.setPresetPattern)
+    setCustomPattern = _serialized(WifiLedBulb.setCustomPattern)
+
+    @_serialized
+    def connect(self, retry=0):
+        """Reuse the open socket, or reconnect with backoff if it failed."""
+        now = time.monotonic()
+
+        if self._connected:
+            idle = now - self.last_used
+            if idle < DEFAULT_CONNECTION_IDLE_TIMEOUT and self._drain():
+                return
+            self._connected = False
+
+        if now < self._reconnect_at:
+            return
+
+        # Retry here instead of in the library, which would recurse into this
+        # method and apply the backoff once per attempt
+        for _ in range(retry + 1):
+            super().connect(0)
+
+            try:
+                self._socket.getpeername()
+            except (AttributeError, OSError):
+                continue
+
+            self._connected = True
+            self._backoff = DEFAULT_RECONNECT_MIN_BACKOFF
+            self.last_used = now
+            return
+
+        self._reconnect_at = now + self._backoff
+        self._backoff = min(self._backoff * 2, DEFAULT_RECONNECT_MAX_BACKOFF)
+
+    @_serialized
+    def close(self):
+        """Close the socket, the next request reconnects."""
+        self._connected = False
+        super().close()
+
+    def _drain(self) -> bool:
+        """Discard unread data on the socket, return False if it was closed."""
+        with self._lock:
+            self._socket.setblocking(0)
+            try:
+                while self._socket.recv(1024):
+                    pass
+                return False
+            except BlockingIOError:
+                return True
+            except OSError:
+                return False
+            finally:
+                self._socket.setblocking(1)
+
+    def _send_msg(self, msg):
+        """Send a message, invalidating the connection if it failed."""
+        try:
+            super()._send_msg(msg)
+        except OSError:
+            self._connected = False
+            raise
+
+        self.last_used = time.monotonic()
+
+    def _read_msg(self, expected):
+        """Read a message, invalidating the connection on a bad read."""
+        rx = super()._read_msg(expected)
+
+        if len(rx) < expected:
+            self._connected = False
+        elif expected == self._query_len and rx[0] not in STATE_RESPONSE_HEADERS:
+            # Leftovers from an earlier reply, query_state retries on a new socket
+            self._connected = False
+            return bytearray()
+
+        return rx
+
+
+class _CommandBatcher:
+    """Coalesce bursts of color writes to a bulb into the last one."""
+
+    def __init__(self, hass):
+        """Initialize the command batcher."""
+        self._hass = hass
+        self._lock = threading.Lock()
+        self._pending = None
+        self._pending_key = None
+        self._scheduled = False
+
+    def queue(self, command, *args, **kwargs):
+        """Queue a write, replacing a pending write of the same fields."""
+        key = (command, len(args), frozenset(kwargs))
+
+        with self._lock:
+            if self._pending is not None and self._pending_key != key:
+                # A different write, send the pending one so it isn't lost
+                self._pending()
+
+            self._pending = partial(command, *args, **kwargs)
+            self._pending_key = key
+            if self._scheduled:
+                return
+            self._scheduled = True
+
+        self._hass.loop.call_soon_threadsafe(
+            self._hass.loop.call_later,
+            DEFAULT_COMMAND_BATCH_DELAY,
+            self._async_drain,
+        )
+
+    @callback
+    def _async_drain(self):
+        """Send the queued write from the executor."""
+        self._hass.async_add_executor_job(self._flush_logged)
+
+    def _flush_logged(self):
+        """Send the queued write, logging errors as nobody awaits the result."""
+        try:
+            self.flush()
+        except OSError as error:
+            _LOGGER.warning("Error sending command to flux_led: %s", error)
+
+    def flush(self):
+        """Send the queued write now, if any."""
+        with self._lock:
+            command, self._pending = self._pending, None
+            self._pending_key = None
+            self._scheduled = False
+
+            if command is not None:
+                command()
+
+
+class FluxLedUpdateCoordinator(DataUpdateCoordinator):
+    """Class to poll the state of all flux_led bulbs of a config entry."""
+
+    def __init__(self, hass):
+        """Initialize the update coordinator."""
+        self.bulbs = {}
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+        )
+
+    def _update_bulb(self, bulb_id: str, bulb) -> bool:
+        """Fetch the state of a single bulb."""
+        try:
+            bulb.update_state()
+        except OSError as error:
+            _LOGGER.warning("Error updating flux_led %s: %s", bulb_id, error)
+            return False
+
+        return True
+
+    async def _async_update_data(self):
+        """Fetch the state of all bulbs concurrently."""
+        bulbs = list(self.bulbs.items())
+        results = await asyncio.gather(
+            *[
+                self.hass.async_add_executor_job(self._update_bulb, bulb_id, bulb)
+                for bulb_id, bulb in bulbs
+            ]
+        )
+
+        return {bulb_id: result for (bulb_id, _), result in zip(bulbs, results)}
+
+
+class FluxLight(CoordinatorEntity, LightEntity):
     """Represents a Flux Light entity."""
 
-    def __init__(self, unique_id: str, device: dict, effect_speed: int, bulb):
+    def __init__(
+        self,
+        coordinator: FluxLedUpdateCoordinator,
+        unique_id: str,
+        device: dict,
+        effect_speed: int,
+        bulb,
+    ):
         """Initialize the Flux light entity."""
+        super().__init__(coordinator)
         self._name = device[CONF_NAME]
         self._unique_id = unique_id
         self._icon = "mdi:lightbulb"
-        self._attrs = {}
         self._state = None
         self._brightness = None
         self._hs_color = None
@@ -251,20 +563,21 @@ class FluxLight(LightEntity):
         self._last_brightness = None
         self._last_hs_color = None
         self._ip_address = device[CONF_HOST]
+        self._attrs = MappingProxyType({"ip_address": self._ip_address})
         self._effect_speed = effect_speed
         self._mode = None
+        self._get_rgbww = None
         self._get_rgbw = None
         self._get_rgb = None
         self._bulb = bulb
+        self._batcher = None
+        self._throttled_turn_on = None
+        self._throttle_timer = None
+        self._last_reported = None
 
     async def async_remove_light(self, device: dict):
         """Remove a bulb device when it is removed from options."""
 
-        bulb_id = device["device_id"]
-
-        if self._unique_id != bulb_id:
-            return
-
         entity_registry = await self.hass.helpers.entity_registry.async_get_registry()
         entity_entry = entity_registry.async_get(self.entity_id)
 
@@ -290,26 +603,76 @@ class FluxLight(LightEntity):
         """Run when the entity is about to be added to hass."""
         await super().async_added_to_hass()
 
-        async_dispatcher_connect(
-            self.hass, SIGNAL_REMOVE_DEVICE, self.async_remove_light
+        self._batcher = _CommandBatcher(self.hass)
+
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                f"{SIGNAL_REMOVE_DEVICE}_{self._unique_id}",
+                self.async_remove_light,
+            )
+        )
+
+        self._async_update_from_bulb()
+
+    async def async_will_remove_from_hass(self):
+        """Stop polling the bulb and close its socket when the entity is removed."""
+        await super().async_will_remove_from_hass()
+
+        if self._throttle_timer is not None:
+            self._throttle_timer.cancel()
+
+        self.coordinator.bulbs.pop(self._unique_id, None)
+
+        await self.hass.async_add_executor_job(self._bulb.close)
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Handle updated bulb state from the coordinator."""
+        self._async_update_from_bulb()
+
+        if self._reported_state() != self._last_reported:
+            self.async_write_ha_state()
+
+    @callback
+    def async_write_ha_state(self):
+        """Write the state to the state machine and remember what was written."""
+        self._last_reported = self._reported_state()
+        super().async_write_ha_state()
+
+    def _reported_state(self):
+        """Return the values which make up the state written to hass."""
+        return (
+            self.available,
+            self._state,
+            self._brightness,
+            self._hs_color,
+            self._white_value,
+            self._current_effect,
+            self._mode,
         )
 
     def update_bulb_info(self):
         """Update the bulb information."""
-        self._bulb.update_state()
-        self._get_rgbw = self._bulb.getRgbw()
-        self._get_rgb = self._bulb.getRgb()
+        if self._bulb.mode == "color":
+            # Same channels as getRgbww(), without unpacking raw_state per getter
+            raw_state = self._bulb.raw_state
+            self._get_rgbww = tuple(raw_state[6:10]) + tuple(raw_state[11:12])
+        else:
+            self._get_rgbww = (255, 255, 255, 255, 255)
 
-    @Throttle(timedelta(seconds=DEFAULT_SCAN_INTERVAL))
-    def update(self):
-        """Fetch the data from this light bulb."""
+        self._get_rgbw = self._get_rgbww[:4]
+        self._get_rgb = self._get_rgbww[:3]
 
-        try:
-            self.update_bulb_info()
-        except BrokenPipeError as error:
-            _LOGGER.warning("Error updating flux_led: %s", error)
+    @callback
+    def _async_update_from_bulb(self):
+        """Read the state polled from this light bulb by the coordinator."""
+
+        if not (self.coordinator.data or {}).get(self._unique_id):
             return
 
+        self.update_bulb_info()
+
         if self._bulb.mode == "ww":
             self._mode = MODE_WHITE
         elif self._bulb.rgbwcapable and not self._bulb.rgbwprotocol:
@@ -318,12 +681,10 @@ class FluxLight(LightEntity):
             self._mode = MODE_RGB
 
         if self._mode == MODE_RGBCW:
-            white_temp = self.temperature_cw()
-            self._white_value = (
-                white_temp[0] if white_temp[0] > white_temp[1] else white_temp[1]
-            )
+            warm, cold = self._get_rgbww[3], self._get_rgbww[4]
+            self._white_value = max(cold, warm)
 
-            if white_temp[0] or white_temp[1]:
+            if warm or cold:
                 self._brightness = 0
 
         elif self._mode == MODE_RGBWW:
@@ -337,9 +698,10 @@ class FluxLight(LightEntity):
             if self._mode == MODE_WHITE:
                 self._brightness = self._white_value
             else:
-                self._brightness = self._bulb.brightness
+                # HSV value of the color, as the bulb's brightness property does
+                self._brightness = max(self._get_rgb)
 
-        self._hs_color = color_util.color_RGB_to_hs(*self._get_rgb)
+        self._hs_color = _rgb_to_hs(*self._get_rgb)
 
         self._current_effect = self._bulb.raw_state[3]
 
@@ -384,27 +746,21 @@ class FluxLight(LightEntity):
 
     def temperature_cw(self):
         """Return the cold white temperature."""
-        rgbww = self._bulb.getRgbww()
-        return [rgbww[4], rgbww[3]]
+        return [self._get_rgbww[4], self._get_rgbww[3]]
 
     def temperature_ww(self):
         """Return the warm white temperature."""
-        rgbww = self._bulb.getRgbww()
-        return rgbww[3]
+        return self._get_rgbww[3]
 
     @property
     def supported_features(self):
         """Return the supported features for this light."""
-        if self._mode == MODE_RGBW or self._mode == MODE_RGBCW:
-            return SUPPORT_FLUX_LED | SUPPORT_WHITE_VALUE | SUPPORT_COLOR_TEMP
-        if self._mode == MODE_RGBWW:
-            return SUPPORT_FLUX_LED | SUPPORT_WHITE_VALUE
-        return SUPPORT_FLUX_LED
+        return _SUPPORTED_FEATURES_BY_MODE.get(self._mode, SUPPORT_FLUX_LED)
 
     @property
     def effect_list(self):
         """Return the list of supported effects."""
-        return FLUX_EFFECT_LIST + [EFFECT_CUSTOM]
+        return FLUX_EFFECT_LIST
 
     @property
     def effect(self):
@@ -414,17 +770,11 @@ class FluxLight(LightEntity):
         if current_mode == EFFECT_CUSTOM_CODE:
             return EFFECT_CUSTOM
 
-        for effect, code in EFFECT_MAP.items():
-            if current_mode == code:
-                return effect
-
-        return None
+        return EFFECT_ID_TO_NAME.get(current_mode)
 
     @property
     def device_state_attributes(self):
         """Return the attributes."""
-        self._attrs["ip_address"] = self._ip_address
-
         return self._attrs
 
     @property
@@ -440,14 +790,59 @@ class FluxLight(LightEntity):
             ATTR_MODEL: device_model,
         }
 
+    async def async_turn_on(self, **kwargs):
+        """Turn on the light and report the new state."""
+        if self.is_on and kwargs and kwargs.keys() <= THROTTLED_TURN_ON_ATTRS:
+            # Keep the latest value of each attribute, not only the last call
+            self._throttled_turn_on = {**(self._throttled_turn_on or {}), **kwargs}
+
+            if self._throttle_timer is None:
+                self._throttle_timer = self.hass.loop.call_later(
+                    DEFAULT_TURN_ON_THROTTLE, self._async_throttle_elapsed
+                )
+            return
+
+        await self._async_send_throttled_turn_on()
+        await super().async_turn_on(**kwargs)
+        self.async_write_ha_state()
+
+    async def async_turn_off(self, **kwargs):
+        """Turn off the light and report the new state."""
+        self._throttled_turn_on = None
+
+        await super().async_turn_off(**kwargs)
+        self.async_write_ha_state()
+
+    @callback
+    def _async_throttle_elapsed(self):
+        """Send the last throttled turn_on call."""
+        self._throttle_timer = None
+        self.hass.async_create_task(self._async_send_throttled_turn_on())
+
+    async def _async_send_throttled_turn_on(self):
+        """Send the pending throttled turn_on call, if any."""
+        kwargs, self._throttled_turn_on = self._throttled_turn_on, None
+
+        if kwargs is None:
+            return
+
+        await self.hass.async_add_executor_job(partial(self.turn_on, **kwargs))
+        self.async_write_ha_state()
+
     def turn_on(self, **kwargs):
         """Turn on the light."""
 
+        if not kwargs:
+            self._state = True
+            self._batcher.flush()
+            self._bulb.turnOn()
+            return
+
         rgb = None
         hs_color = kwargs.get(ATTR_HS_COLOR)
 
         if hs_color:
-            rgb = color_util.color_hs_to_RGB(*hs_color)
+            rgb = _hs_to_rgb(*hs_color)
 
         brightness = kwargs.get(ATTR_BRIGHTNESS)
         effect = kwargs.get(ATTR_EFFECT)
@@ -460,40 +855,26 @@ class FluxLight(LightEntity):
                 white = self.white_value if self.white_value > 0 else 255
 
             if self._mode == MODE_RGBCW:
-                # 153 - 500 color temp in mired
-
-                # Map mired range from light input to kelvin range for bulb
-                mired_min = 500
-                mired_max = 153
-                kelvin_min = 2700
-                kelvin_max = 6500
-
-                # Map mired to kelvin specifically for the setWhiteTemperature since it wants 2700~6500 kelvin and
-                # we have 153~500 mired as an input which doesn't match up the way we want
-                color_temp_kelvin = (color_temp - mired_min) / (
-                    mired_max - mired_min
-                ) * (kelvin_max - kelvin_min) + kelvin_min
-
-                color_temp_kelvin = max(color_temp_kelvin - 2700, 0)
-                warm = 255 * (1 - (color_temp_kelvin / 3800))
-                cold = min(255 * color_temp_kelvin / 3800, 255)
-                warm *= white / 255  # White controls brightness
-                cold *= white / 255
+                warm_ratio, cold_ratio = _MIRED_TO_WARM_COLD[
+                    min(max(int(color_temp), MIRED_MAX), MIRED_MIN)
+                ]
+                warm = warm_ratio * white  # White controls brightness
+                cold = cold_ratio * white
 
                 if (
                     warm > cold
                 ):  # Warm side will activate both cold and warm leds at same rate (much brighter warm mode)
                     cold = warm
 
-                self._bulb.setRgbw(w=warm, w2=cold)
+                self._batcher.queue(self._bulb.setRgbw, w=warm, w2=cold)
                 return
 
             if brightness is None:
                 brightness = self.brightness
             if color_temp > COLOR_TEMP_WARM_VS_COLD_WHITE_CUT_OFF:
-                self._bulb.setRgbw(w=brightness)
+                self._batcher.queue(self._bulb.setRgbw, w=brightness)
             else:
-                self._bulb.setRgbw(w2=brightness)
+                self._batcher.queue(self._bulb.setRgbw, w2=brightness)
             return
 
         if white is not None:
@@ -504,24 +885,28 @@ class FluxLight(LightEntity):
                     current_temp[1] = 255
                 current_temp[0] *= white / 255
                 current_temp[1] *= white / 255
-                self._bulb.setRgbw(w=current_temp[1], w2=current_temp[0])
+                self._batcher.queue(
+                    self._bulb.setRgbw, w=current_temp[1], w2=current_temp[0]
+                )
                 return
             if self._mode == MODE_RGBWW:
-                self._bulb.setWarmWhite255(white)
+                self._batcher.queue(self._bulb.setWarmWhite255, white)
                 return
 
         if effect == EFFECT_RANDOM:
-            color_red = random.randint(0, 255)
-            color_green = random.randint(0, 255)
-            color_blue = random.randint(0, 255)
+            color = random.getrandbits(24)
+            color_red = color & 0xFF
+            color_green = (color >> 8) & 0xFF
+            color_blue = color >> 16
 
+            self._batcher.flush()
             self._bulb.setRgbw(
                 r=color_red,
                 g=color_green,
                 b=color_blue,
             )
 
-            self._hs_color = color_util.color_RGB_to_hs(
+            self._hs_color = _rgb_to_hs(
                 color_red,
                 color_green,
                 color_blue,
@@ -531,11 +916,13 @@ class FluxLight(LightEntity):
 
         if effect in EFFECT_MAP:
             self._current_effect = effect
+            self._batcher.flush()
             self._bulb.setPresetPattern(EFFECT_MAP[effect], self._effect_speed)
             return
 
         if not brightness and not rgb and not self._state:
             self._state = True
+            self._batcher.flush()
             self._bulb.turnOn()
             return
 
@@ -545,24 +932,24 @@ class FluxLight(LightEntity):
         self._brightness = brightness
 
         if not rgb and self._last_hs_color:
-            rgb = color_util.color_hs_to_RGB(*self._last_hs_color)
-
-        self._hs_color = color_util.color_RGB_to_hs(*tuple(rgb))
+            rgb = _hs_to_rgb(*self._last_hs_color)
 
         if not white and self._mode == MODE_RGBW:
             white = self.white_value
 
-        self._state = True
-        self._hs_color = color_util.color_RGB_to_hs(*tuple(rgb))
-
         if self._mode == MODE_WHITE:
-            self._bulb.setRgbw(0, 0, 0, w=brightness)
+            self._batcher.queue(self._bulb.setRgbw, 0, 0, 0, w=brightness)
 
         elif self._mode == MODE_RGBW:
-            self._bulb.setRgbw(*tuple(rgb), w=white, brightness=brightness)
+            self._batcher.queue(
+                self._bulb.setRgbw, *rgb, w=white, brightness=brightness
+            )
 
         else:
-            self._bulb.setRgb(*tuple(rgb), brightness=brightness)
+            self._batcher.queue(self._bulb.setRgb, *rgb, brightness=brightness)
+
+        self._state = True
+        self._hs_color = _rgb_to_hs(*rgb)
 
     def turn_off(self, **kwargs):
         """Turn off the light."""
@@ -572,6 +959,7 @@ class FluxLight(LightEntity):
 
         self._state = False
 
+        self._batcher.flush()
         self._bulb.turnOff()
 
     def set_custom_effect(self, colors: list, speed_pct: int, transition: str):
@@ -580,6 +968,8 @@ class FluxLight(LightEntity):
         if not self.is_on:
             self.turn_on()
 
+        self._batcher.flush()
         self._bulb.setCustomPattern(colors, speed_pct, transition)
 
         self._state = True
+        self.hass.add_job(self.async_write_ha_state)